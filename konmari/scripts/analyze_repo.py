@@ -14,53 +14,62 @@ Outputs structured JSON for an AI assistant to present as a cleanup ceremony.
 """
 
 import os
+import pickle
+import random
 import sys
 import json
+import glob
+import mmap
 import subprocess
 import re
+import threading
 import ast
+import bisect
+import itertools
+import time
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
 from datetime import datetime, timedelta
 from pathlib import Path
 from collections import defaultdict
-from typing import Dict, List, Optional, Tuple, Any
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from functools import cached_property, lru_cache, partial
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    Iterator,
+    List,
+    NamedTuple,
+    Optional,
+    Set,
+    Tuple,
+    Union,
+)
 
 # =============================================================================
 # KONMARI CATEGORY 1: DEAD FILES (Clothing)
 # =============================================================================
 
+# Patterns are tried in order and the first match wins, so related suffixes
+# are grouped into non-capturing alternations that share one extension list.
 DEAD_FILE_PATTERNS = [
     # Backup patterns
-    r".*_old\.(md|py|js|ts|jsx|tsx|go|rs|txt|json|yaml|yml)$",
-    r".*_backup\.(md|py|js|ts|jsx|tsx|go|rs|txt|json|yaml|yml)$",
-    r".*_bak\.(md|py|js|ts|jsx|tsx|go|rs|txt|json|yaml|yml)$",
-    r".*\.bak$",
-    r".*\.backup$",
-    r".*\.old$",
-    r"^backup_.*",
-    r"^old_.*",
+    r".*_(?:old|backup|bak)\.(?:md|py|js|ts|jsx|tsx|go|rs|txt|json|yaml|yml)$",
+    r".*\.(?:bak|backup|old)$",
+    r"^(?:backup|old)_.*",
     # Temporary patterns
-    r"^temp_.*",
-    r"^tmp_.*",
-    r".*\.tmp$",
-    r".*\.temp$",
+    r"^(?:temp|tmp)_.*",
+    r".*\.(?:tmp|temp)$",
     # Version patterns
-    r".*_v\d+\.(md|py|js|ts|jsx|tsx|go|rs|txt)$",
-    r".*_copy\.(md|py|js|ts|jsx|tsx|go|rs|txt)$",
-    r".*_copy\d*\.(md|py|js|ts|jsx|tsx|go|rs|txt)$",
-    r".*\sCopy\.(md|py|js|ts|jsx|tsx|go|rs|txt)$",
-    r".*\s\(\d+\)\.(md|py|js|ts|jsx|tsx|go|rs|txt)$",
+    r".*(?:_v\d+|_copy\d*|\sCopy|\s\(\d+\))\.(?:md|py|js|ts|jsx|tsx|go|rs|txt)$",
     # Draft patterns
-    r"^draft_.*",
-    r"^scratch_.*",
+    r"^(?:draft|scratch)_.*",
     r"^notes_.*\.md$",
     # Orphan experimental scripts
     r"^test_.*\.py$",
-    r"^debug_.*\.(py|js|ts)$",
-    r"^scratch.*\.(py|js|ts)$",
-    r"^experiment.*\.(py|js|ts)$",
-    r"^try_.*\.(py|js|ts)$",
-    r"^check_.*\.(py|js|ts)$",
-    r"^verify_.*\.(py|js|ts)$",
+    r"^(?:debug_|scratch|experiment|try_|check_|verify_).*\.(?:py|js|ts)$",
 ]
 
 # AI tool session artifacts (expand as needed for your stack)
@@ -77,6 +86,26 @@ AI_TOOL_ARTIFACTS = [
     r"^TODO-ai\.md$",
 ]
 
+# Both lists compiled into a single alternation so each filename is matched in
+# one pass. AI artifacts come first to keep their precedence; every pattern is
+# wrapped in a named group that maps back to (pattern, is_ai_artifact).
+_DEAD_FILE_TABLE = {
+    f"p{i}": (pattern, i < len(AI_TOOL_ARTIFACTS))
+    for i, pattern in enumerate(AI_TOOL_ARTIFACTS + DEAD_FILE_PATTERNS)
+}
+_DEAD_FILE_RE = re.compile(
+    "|".join(
+        f"(?P<{name}>{pattern})" for name, (pattern, _) in _DEAD_FILE_TABLE.items()
+    ),
+    re.IGNORECASE,
+)
+
+# Trailing copy/backup/version suffixes stripped before comparing file stems
+DUP_SUFFIX_RE = re.compile(
+    r"(?:_old|_backup|_copy|_new|_v\d+|_final|_draft|_bak| copy| \(\d+\))+$",
+    re.IGNORECASE,
+)
+
 # =============================================================================
 # KONMARI CATEGORY 2: DEPENDENCIES (Books)
 # =============================================================================
@@ -88,6 +117,25 @@ ECOSYSTEM_MARKERS = {
     "rust": ["Cargo.toml"],
 }
 
+# Import/usage patterns, compiled once and reused for every source file. Source
+# patterns are bytes so files are scanned without decoding them; they only
+# match ASCII, and only the captured names are decoded.
+_PY_IMPORT_RE = re.compile(rb"^(?:from|import)\s+(\w+)", re.MULTILINE)
+_REQ_SPEC_SPLIT_RE = re.compile(r"[=<>!~\[\]]")
+_JS_IMPORT_RES = [
+    re.compile(rb'require\([\'"]([^\'"\./][^\'"]*?)[\'"]\)'),  # require('package')
+    re.compile(rb'from\s+[\'"]([^\'"\./][^\'"]*?)[\'"]'),  # from 'package'
+    re.compile(rb'import\s+[\'"]([^\'"\./][^\'"]*?)[\'"]'),  # import 'package'
+]
+_GO_REQUIRE_RE = re.compile(rb"require\s+(\S+)\s+v")
+_GO_REQUIRE_BLOCK_RE = re.compile(rb"^\s+(\S+)\s+v", re.MULTILINE)
+_GO_IMPORT_RE = re.compile(rb'import\s+(?:\(\s*)?["\']([^"\']+)["\']')
+_GO_IMPORT_BLOCK_RE = re.compile(rb'^\s+["\']([^"\']+)["\']', re.MULTILINE)
+_CARGO_DEPS_HEADER_RE = re.compile(r"\[(.*dependencies.*)\]")
+_RUST_USE_RE = re.compile(rb"use\s+(\w+)")
+_RUST_EXTERN_RE = re.compile(rb"extern\s+crate\s+(\w+)")
+_RUST_PATH_RE = re.compile(rb"(\w+)::")
+
 # =============================================================================
 # AI COMMIT DETECTION
 # =============================================================================
@@ -105,6 +153,13 @@ AI_COMMIT_PATTERNS = [
     r"minor\s+(changes|updates|fixes)",
 ]
 
+# Compiled once. The combined alternation rejects most subjects in a single
+# search; only subjects it matches are scored pattern by pattern.
+_AI_COMMIT_RES = [(p, re.compile(p, re.IGNORECASE)) for p in AI_COMMIT_PATTERNS]
+_AI_COMMIT_ANY_RE = re.compile(
+    "|".join(f"(?:{p})" for p in AI_COMMIT_PATTERNS), re.IGNORECASE
+)
+
 AI_COMMIT_SIGNATURES = [
     "Generated with Claude Code",
     "Co-Authored-By: Claude",
@@ -116,62 +171,347 @@ AI_COMMIT_SIGNATURES = [
     "Generated with Cursor",
 ]
 
+# Every signature above starts with one of these. Most commits contain neither,
+# so they skip the per-signature scan after two substring searches.
+_AI_SIGNATURE_STEMS = ("Generated with ", "Co-Authored-By: ")
+
 # =============================================================================
 # CONTEXT LIMITS
 # =============================================================================
 
 MAX_RECOMMENDED_LINES = 500
 MAX_RECOMMENDED_TOKENS = 4000
+
+# A file has at most size + 1 lines and size // 4 estimated tokens, so anything
+# smaller than this cannot exceed either limit and is never opened
+_MIN_HEAVY_BYTES = min(MAX_RECOMMENDED_LINES, (MAX_RECOMMENDED_TOKENS + 1) * 4)
 CONTEXT_HEAVY_EXTENSIONS = [".md", ".txt", ".rst", ".json", ".yaml", ".yml"]
 
+# =============================================================================
+# REPOSITORY TRAVERSAL
+# =============================================================================
+
+# Directories never descended into (hidden directories are always skipped)
+SKIP_DIRS = frozenset(
+    ["node_modules", "venv", "__pycache__", "dist", "build", "target"]
+)
+
+# Go and Rust dependency scans skip only these, keyed by the root manifest
+# that enables each scan; the walk then prunes what every active scan skips
+GO_SKIP_DIRS = frozenset(["vendor", "node_modules"])
+RUST_SKIP_DIRS = frozenset(["target", "node_modules"])
+MANIFEST_SKIP_DIRS = {"go.mod": GO_SKIP_DIRS, "Cargo.toml": RUST_SKIP_DIRS}
+
+# Source files by ecosystem, bucketed during the single repository walk
+PYTHON_EXTENSIONS = (".py",)
+JS_EXTENSIONS = (".js", ".jsx", ".ts", ".tsx", ".mjs", ".cjs")
+GO_EXTENSIONS = (".go",)
+RUST_EXTENSIONS = (".rs",)
+
+# Files bucketed for the documentation, legacy and context-heavy analyzers
+DOC_EXTENSIONS = (".md", ".rst", ".txt")
+LEGACY_CODE_EXTENSIONS = (".py", ".js", ".ts", ".jsx", ".tsx", ".go", ".rs", ".java")
+
+# AST fields holding nested statement lists (function/class/if/try/with/match
+# bodies); imports are statements, so these are the only fields worth visiting
+_STATEMENT_BLOCK_FIELDS = ("body", "orelse", "finalbody", "handlers", "cases")
+
+# Below this many Python files, process pool startup outweighs parsing serially
+PARALLEL_PARSE_THRESHOLD = 200
+
+# Below this many files, reading them serially beats starting a thread pool
+PARALLEL_SCAN_THRESHOLD = 64
+
 # =============================================================================
 # HELPER FUNCTIONS
 # =============================================================================
 
 
+# Seconds a git command may run before it is abandoned
+GIT_TIMEOUT_SECONDS = 30
+
+
 def run_git_command(cmd: List[str], cwd: Optional[str] = None) -> Optional[str]:
     """Run a git command and return output."""
     try:
         result = subprocess.run(
-            cmd, capture_output=True, text=True, cwd=cwd, timeout=30
+            cmd, capture_output=True, text=True, cwd=cwd, timeout=GIT_TIMEOUT_SECONDS
         )
         return result.stdout.strip() if result.returncode == 0 else None
     except (subprocess.TimeoutExpired, FileNotFoundError):
         return None
 
 
-def get_repo_root(path: str) -> str:
-    """Find git repo root from given path."""
+def iter_git_records(cmd: List[str], cwd: str, delimiter: bytes) -> Iterator[bytes]:
+    """
+    Run a git command and yield its raw output split on delimiter as it streams.
+
+    Records are stripped and empty ones skipped, so the whole output is never
+    held in memory at once. Yields nothing if git cannot be started, and stops
+    if git fails or runs past GIT_TIMEOUT_SECONDS.
+    """
+    try:
+        proc = subprocess.Popen(
+            cmd,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.DEVNULL,
+            cwd=cwd,
+        )
+    except FileNotFoundError:
+        return
+
+    # A hung git (credential prompt, slow filesystem) is killed, which closes
+    # its stdout and ends the read loop below
+    watchdog = threading.Timer(GIT_TIMEOUT_SECONDS, proc.kill)
+    watchdog.start()
+    try:
+        with proc:
+            pending = b""
+            for chunk in iter(lambda: proc.stdout.read(1 << 16), b""):
+                # The last piece may be a record cut off mid-chunk; carry it over
+                *records, pending = (pending + chunk).split(delimiter)
+                for record in records:
+                    record = record.strip()
+                    if record:
+                        yield record
+            # A killed or failed git may have stopped mid-record
+            if proc.wait() != 0:
+                return
+            pending = pending.strip()
+            if pending:
+                yield pending
+    finally:
+        watchdog.cancel()
+
+
+def get_repo_root(path: str, git_cache: Optional[Dict[str, bool]] = None) -> str:
+    """
+    Find git repo root from given path.
+
+    git_cache maps paths already known to be inside (or outside) a git
+    repository; one analysis shares it so later checks spawn no git process.
+    """
     result = run_git_command(["git", "rev-parse", "--show-toplevel"], cwd=path)
+    if result and git_cache is not None:
+        git_cache[result] = True
     return result if result else path
 
 
-def is_git_repo(path: str) -> bool:
-    """Check if path is inside a git repository."""
-    return run_git_command(["git", "rev-parse", "--git-dir"], cwd=path) is not None
-
-
-def count_files(path: str) -> int:
-    """Count total files in directory (excluding hidden and common ignore patterns)."""
-    count = 0
-    for root, dirs, files in os.walk(path):
-        dirs[:] = [
-            d
-            for d in dirs
-            if not d.startswith(".")
-            and d
-            not in [
-                "node_modules",
-                "venv",
-                "__pycache__",
-                "dist",
-                "build",
-                "target",
-                ".git",
-            ]
-        ]
-        count += len(files)
-    return count
+def is_git_repo(path: str, git_cache: Optional[Dict[str, bool]] = None) -> bool:
+    """Check if path is inside a git repository (see get_repo_root for git_cache)."""
+    if git_cache is not None and path in git_cache:
+        return git_cache[path]
+    result = run_git_command(["git", "rev-parse", "--git-dir"], cwd=path) is not None
+    if git_cache is not None:
+        git_cache[path] = result
+    return result
+
+
+def iter_repo_files(
+    repo_path: str,
+    prune_dirs: frozenset = SKIP_DIRS,
+    track_dirs: frozenset = SKIP_DIRS | GO_SKIP_DIRS | RUST_SKIP_DIRS,
+) -> Iterator[Tuple[str, os.DirEntry, frozenset]]:
+    """
+    Yield (rel_path, entry, inside) for every file under repo_path.
+
+    Hidden directories and prune_dirs are pruned, and files are visited in the
+    same order as os.walk. `inside` holds the track_dirs names found among the
+    file's parent directories, so callers can apply their own exclusions.
+    """
+    # Every entry.path starts with repo_path plus a separator, so slicing it
+    # off is equivalent to os.path.relpath without re-normalizing each path
+    prefix_len = len(os.path.join(repo_path, ""))
+    stack = [(repo_path, frozenset())]
+    while stack:
+        path, inside = stack.pop()
+        try:
+            scanner = os.scandir(path)
+        except OSError:
+            continue
+        subdirs = []
+        with scanner:
+            for entry in scanner:
+                try:
+                    is_dir = entry.is_dir()
+                except OSError:
+                    is_dir = False
+                if not is_dir:
+                    yield entry.path[prefix_len:], entry, inside
+                elif (
+                    not entry.is_symlink()
+                    and not entry.name.startswith(".")
+                    and entry.name not in prune_dirs
+                ):
+                    name = entry.name
+                    if name in track_dirs:
+                        subdirs.append((entry.path, inside | {name}))
+                    else:
+                        subdirs.append((entry.path, inside))
+        stack.extend(reversed(subdirs))
+
+
+class RepoFile(NamedTuple):
+    """A file seen by the walk, stat'ed exactly once."""
+
+    rel_path: str
+    name: str
+    path: str
+    size: int
+    # None when the file could not be stat'ed (e.g. a dangling symlink)
+    mtime: Optional[float]
+
+
+@dataclass
+class RepoIndex:
+    """Files collected in a single walk, bucketed for the per-category analyzers."""
+
+    root: str
+    files: List[RepoFile] = field(default_factory=list)
+    py_files: List[str] = field(default_factory=list)
+    js_files: List[str] = field(default_factory=list)
+    go_files: List[str] = field(default_factory=list)
+    rust_files: List[str] = field(default_factory=list)
+    md_files: List[RepoFile] = field(default_factory=list)
+    config_files: List[RepoFile] = field(default_factory=list)
+    code_files: List[RepoFile] = field(default_factory=list)
+    heavy_files: List[RepoFile] = field(default_factory=list)
+    # One reference time for every age in the analysis, taken at the walk
+    scanned_at: float = field(default_factory=time.time)
+    ecosystem_markers: Dict[str, List[str]] = field(
+        default_factory=lambda: defaultdict(list)
+    )
+
+    @cached_property
+    def package_json(self) -> Optional[Any]:
+        """Root package.json, parsed once and shared; None if absent or invalid."""
+        if "package.json" not in self.ecosystem_markers.get("package.json", ()):
+            return None
+        try:
+            # json.loads detects UTF-8/16/32 itself, so skip the text-mode decode
+            with open(os.path.join(self.root, "package.json"), "rb") as f:
+                return json.loads(f.read())
+        except (IOError, ValueError):
+            return None
+
+
+def collect_repo_index(repo_path: str) -> RepoIndex:
+    """Walk the repository once and bucket every file for the analyzers."""
+    index = RepoIndex(root=repo_path)
+    all_markers = {m for markers in ECOSYSTEM_MARKERS.values() for m in markers}
+
+    # Only the Go and Rust finders look inside SKIP_DIRS, and they bail out
+    # without a root manifest, so other repositories keep the cheap walk
+    prune_dirs = SKIP_DIRS
+    for manifest, skip_dirs in MANIFEST_SKIP_DIRS.items():
+        if os.path.exists(os.path.join(repo_path, manifest)):
+            prune_dirs = prune_dirs & skip_dirs
+
+    for rel_path, entry, inside in iter_repo_files(repo_path, prune_dirs):
+        name = entry.name
+
+        # Go and Rust keep their own exclusions: their sources under build/,
+        # dist/ and the like still count as usages, vendored copies don't
+        if name.endswith(GO_EXTENSIONS):
+            if inside.isdisjoint(GO_SKIP_DIRS):
+                index.go_files.append(entry.path)
+        elif name.endswith(RUST_EXTENSIONS):
+            if inside.isdisjoint(RUST_SKIP_DIRS):
+                index.rust_files.append(entry.path)
+        if not inside.isdisjoint(SKIP_DIRS):
+            continue
+
+        try:
+            st = entry.stat()
+            size, mtime = st.st_size, st.st_mtime
+        except OSError:
+            size, mtime = 0, None
+        repo_file = RepoFile(rel_path, name, entry.path, size, mtime)
+        index.files.append(repo_file)
+
+        if name.endswith(PYTHON_EXTENSIONS):
+            index.py_files.append(entry.path)
+        elif name.endswith(JS_EXTENSIONS):
+            index.js_files.append(entry.path)
+
+        if name in all_markers:
+            index.ecosystem_markers[name].append(rel_path)
+
+        if name.endswith(DOC_EXTENSIONS) and not name.startswith("."):
+            index.md_files.append(repo_file)
+        if name.endswith(LEGACY_CODE_EXTENSIONS):
+            index.code_files.append(repo_file)
+        if os.path.splitext(name)[1].lower() in CONTEXT_HEAVY_EXTENSIONS:
+            index.heavy_files.append(repo_file)
+        if _CONFIG_ANY_RE.match(name):
+            index.config_files.append(repo_file)
+
+    return index
+
+
+@contextmanager
+def mapped_file(path: str) -> Iterator[Union[mmap.mmap, bytes]]:
+    """
+    Memory-map a file read-only so bytes patterns can scan it without a copy.
+
+    Empty files cannot be mapped and yield b"" instead.
+    """
+    with open(path, "rb") as f:
+        if os.fstat(f.fileno()).st_size == 0:
+            yield b""
+            return
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+            yield mapped
+
+
+def read_bytes(path: str, size: int) -> bytes:
+    """Read a whole file, sized from its stat so one read usually suffices."""
+    with open(path, "rb", buffering=0) as f:
+        # Ask for one byte past the stat size to detect a file that grew; a
+        # short or long first read falls back to reading until EOF
+        raw = f.read(size + 1)
+        if len(raw) != size:
+            raw += f.readall()
+    return raw
+
+
+def decode_text(raw: bytes) -> str:
+    """
+    Decode file bytes as open(path, encoding="utf-8", errors="ignore") would.
+
+    Universal newlines are translated too, so the text matches a text-mode read.
+    """
+    text = raw.decode("utf-8", "ignore")
+    if "\r" in text:
+        text = text.replace("\r\n", "\n").replace("\r", "\n")
+    return text
+
+
+def read_text(path: str, size: int) -> str:
+    """Read a whole file as text (see read_bytes and decode_text)."""
+    return decode_text(read_bytes(path, size))
+
+
+def _call_or_none(fn: Callable[[Any], Any], item: Any) -> Any:
+    """Call fn(item), mapping an unreadable file to None."""
+    try:
+        return fn(item)
+    except OSError:
+        return None
+
+
+def map_files(fn: Callable[[Any], Any], items: List[Any]) -> List[Any]:
+    """
+    Apply fn to every item in order, giving None where it raised OSError.
+
+    Large batches run on a thread pool so file reads overlap; results are
+    still returned in input order.
+    """
+    if len(items) < PARALLEL_SCAN_THRESHOLD:
+        return [_call_or_none(fn, item) for item in items]
+    workers = min(32, (os.cpu_count() or 1) * 4)
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        return list(executor.map(partial(_call_or_none, fn), items))
 
 
 def estimate_tokens(text: str) -> int:
@@ -179,9 +519,37 @@ def estimate_tokens(text: str) -> int:
     return len(text) // 4
 
 
-def calculate_age_days(mtime: float) -> int:
+def estimate_tokens_from_size(size_bytes: int) -> int:
+    """Rough token estimation for a file without reading it: ~4 bytes per token."""
+    return size_bytes // 4
+
+
+def count_lines(path: str) -> int:
+    """Count lines in a file by scanning raw bytes, without decoding to text."""
+    newlines = 0
+    ends_with_cr = False
+    # Unbuffered: most files fit in the first read, so skip the buffer layer
+    with open(path, "rb", buffering=0) as f:
+        while True:
+            chunk = f.read(1 << 20)
+            if not chunk:
+                break
+            newlines += chunk.count(b"\n")
+            # As in text mode, a lone CR is a line break and CRLF is one break
+            if b"\r" in chunk:
+                newlines += chunk.count(b"\r") - chunk.count(b"\r\n")
+            # A CRLF split across two chunks was counted once in each
+            if ends_with_cr and chunk.startswith(b"\n"):
+                newlines -= 1
+            ends_with_cr = chunk.endswith(b"\r")
+    return newlines + 1
+
+
+def calculate_age_days(mtime: float, now: Optional[float] = None) -> int:
     """Calculate age in days from modification time."""
-    return (datetime.now() - datetime.fromtimestamp(mtime)).days
+    if now is None:
+        now = time.time()
+    return int((now - mtime) // 86400)
 
 
 # =============================================================================
@@ -237,139 +605,88 @@ def calculate_confidence(
 # =============================================================================
 
 
-def find_dead_files(repo_path: str) -> List[Dict]:
+@lru_cache(maxsize=8192)
+def match_dead_file_pattern(filename: str) -> Optional[Tuple[str, bool]]:
+    """
+    Return (pattern, is_ai_artifact) for a dead-file name, or None.
+
+    Memoized per filename: names like index.js or __init__.py repeat across
+    a tree, so most lookups skip the regex entirely.
+    """
+    match = _DEAD_FILE_RE.match(filename)
+    return _DEAD_FILE_TABLE[match.lastgroup] if match else None
+
+
+def find_dead_files(index: RepoIndex) -> List[Dict]:
     """Find files matching dead/stale patterns (Category 1: Clothing)."""
     dead_files = []
 
-    for root, dirs, files in os.walk(repo_path):
-        dirs[:] = [
-            d
-            for d in dirs
-            if not d.startswith(".")
-            and d
-            not in ["node_modules", "venv", "__pycache__", "dist", "build", "target"]
-        ]
-
-        for file in files:
-            filepath = os.path.join(root, file)
-            rel_path = os.path.relpath(filepath, repo_path)
-
-            matched_pattern = None
-            is_ai_artifact = False
-
-            # Check AI tool artifacts first
-            for pattern in AI_TOOL_ARTIFACTS:
-                if re.match(pattern, file, re.IGNORECASE):
-                    matched_pattern = pattern
-                    is_ai_artifact = True
-                    break
-
-            # Check dead file patterns
-            if not matched_pattern:
-                for pattern in DEAD_FILE_PATTERNS:
-                    if re.match(pattern, file, re.IGNORECASE):
-                        matched_pattern = pattern
-                        break
-
-            if matched_pattern:
-                try:
-                    stat = os.stat(filepath)
-                    age_days = calculate_age_days(stat.st_mtime)
-
-                    confidence = calculate_confidence(
-                        {"path": rel_path},
-                        matches_pattern=True,
-                        is_ai_artifact=is_ai_artifact,
-                        age_days=age_days,
-                    )
+    for rel_path, name, _, size, mtime in index.files:
+        matched = match_dead_file_pattern(name)
+        if not matched or mtime is None:
+            continue
 
-                    dead_files.append(
-                        {
-                            "path": rel_path,
-                            "pattern": matched_pattern,
-                            "size_bytes": stat.st_size,
-                            "modified": datetime.fromtimestamp(stat.st_mtime).strftime(
-                                "%Y-%m-%d"
-                            ),
-                            "age_days": age_days,
-                            "confidence": confidence,
-                            "is_ai_artifact": is_ai_artifact,
-                            "category": "dead_files",
-                            "category_name": "Dead Files (Clothing)",
-                            "gratitude": generate_gratitude(
-                                "dead_file", rel_path, age_days
-                            ),
-                        }
-                    )
-                except OSError:
-                    continue
+        matched_pattern, is_ai_artifact = matched
+        age_days = calculate_age_days(mtime, index.scanned_at)
+
+        confidence = calculate_confidence(
+            {"path": rel_path},
+            matches_pattern=True,
+            is_ai_artifact=is_ai_artifact,
+            age_days=age_days,
+        )
+
+        dead_files.append(
+            {
+                "path": rel_path,
+                "pattern": matched_pattern,
+                "size_bytes": size,
+                "modified": time.strftime("%Y-%m-%d", time.localtime(mtime)),
+                "age_days": age_days,
+                "confidence": confidence,
+                "is_ai_artifact": is_ai_artifact,
+                "category": "dead_files",
+                "category_name": "Dead Files (Clothing)",
+                "gratitude": generate_gratitude("dead_file", rel_path),
+            }
+        )
 
     return sorted(dead_files, key=lambda x: x["confidence"], reverse=True)
 
 
-def find_duplicates(repo_path: str) -> List[Dict]:
+def find_duplicates(index: RepoIndex) -> List[Dict]:
     """Find files with similar names suggesting duplicates."""
-    files_by_stem = defaultdict(list)
-
-    for root, dirs, files in os.walk(repo_path):
-        dirs[:] = [
-            d
-            for d in dirs
-            if not d.startswith(".")
-            and d
-            not in ["node_modules", "venv", "__pycache__", "dist", "build", "target"]
-        ]
-
-        for file in files:
-            filepath = os.path.join(root, file)
-            rel_path = os.path.relpath(filepath, repo_path)
-
-            # Normalize filename to find potential duplicates
-            stem = Path(file).stem.lower()
-            ext = Path(file).suffix.lower()
-
-            # Remove common suffixes
-            for suffix in [
-                "_old",
-                "_backup",
-                "_copy",
-                "_new",
-                "_v1",
-                "_v2",
-                "_v3",
-                "_final",
-                "_draft",
-                "_bak",
-                " copy",
-                " (1)",
-                " (2)",
-            ]:
-                stem = stem.replace(suffix, "")
-
-            # Group by normalized stem + extension
-            files_by_stem[(stem, ext)].append(rel_path)
+    # Insertion order keeps groups in first-seen order for ties in the cut
+    groups = defaultdict(list)
+
+    for f in index.files:
+        rel_path = f.rel_path
+        # Normalize filename to find potential duplicates
+        name = Path(f.name)
+        stem = DUP_SUFFIX_RE.sub("", name.stem).lower()
+        ext = name.suffix.lower()
+
+        # Group by normalized stem + extension
+        groups[(stem, ext)].append(rel_path)
 
     duplicates = []
-    for (stem, ext), paths in files_by_stem.items():
-        if len(paths) > 1:
-            duplicates.append(
-                {
-                    "base_name": f"{stem}{ext}",
-                    "files": sorted(paths),
-                    "count": len(paths),
-                    "category": "dead_files",
-                    "category_name": "Dead Files (Clothing)",
-                    "confidence": 70,  # Duplicates are usually safe to consolidate
-                    "reason": "potential_duplicates",
-                    "gratitude": generate_gratitude("duplicate", stem, 0),
-                }
-            )
+    for (stem, ext), paths in groups.items():
+        if len(paths) < 2:
+            continue
+        duplicates.append(
+            {
+                "base_name": f"{stem}{ext}",
+                "files": sorted(paths),
+                "count": len(paths),
+                "category": "dead_files",
+                "category_name": "Dead Files (Clothing)",
+                "confidence": 70,  # Duplicates are usually safe to consolidate
+                "reason": "potential_duplicates",
+                "gratitude": generate_gratitude("duplicate", stem),
+            }
+        )
 
-    return sorted(
-        [d for d in duplicates if d["count"] > 1],
-        key=lambda x: x["count"],
-        reverse=True,
-    )[:20]
+    return sorted(duplicates, key=lambda x: x["count"], reverse=True)[:20]
 
 
 # =============================================================================
@@ -377,36 +694,16 @@ def find_duplicates(repo_path: str) -> List[Dict]:
 # =============================================================================
 
 
-def detect_ecosystems(repo_path: str) -> Dict[str, List[str]]:
+def detect_ecosystems(index: RepoIndex) -> Dict[str, List[str]]:
     """Detect which ecosystems are present in the repo."""
     detected = {}
 
+    # Marker paths are in walk order: the root copy is always listed first,
+    # subdirectory copies (monorepos) follow
     for ecosystem, markers in ECOSYSTEM_MARKERS.items():
         found_markers = []
         for marker in markers:
-            # Check root
-            if os.path.exists(os.path.join(repo_path, marker)):
-                found_markers.append(marker)
-            # Check subdirectories for monorepos
-            for root, dirs, files in os.walk(repo_path):
-                dirs[:] = [
-                    d
-                    for d in dirs
-                    if not d.startswith(".")
-                    and d
-                    not in [
-                        "node_modules",
-                        "venv",
-                        "__pycache__",
-                        "dist",
-                        "build",
-                        "target",
-                    ]
-                ]
-                if marker in files:
-                    rel_path = os.path.relpath(os.path.join(root, marker), repo_path)
-                    if rel_path not in found_markers:
-                        found_markers.append(rel_path)
+            found_markers.extend(index.ecosystem_markers.get(marker, []))
 
         if found_markers:
             detected[ecosystem] = found_markers
@@ -414,44 +711,73 @@ def detect_ecosystems(repo_path: str) -> Dict[str, List[str]]:
     return detected
 
 
-def find_orphaned_python_deps(repo_path: str) -> List[Dict]:
+def extract_python_imports(filepath: str) -> Set[str]:
+    """Return the top-level module names imported by a Python file."""
+    imports = set()
+    try:
+        with open(filepath, "rb") as f:
+            content = f.read()
+    except (IOError, OSError):
+        return imports
+
+    try:
+        # Parsing bytes lets ast honour PEP 263 coding cookies and BOMs
+        tree = ast.parse(content)
+    except (SyntaxError, ValueError):
+        try:
+            # Bytes that don't decode (and have no coding cookie) are dropped,
+            # as a text-mode read with errors="ignore" would
+            tree = ast.parse(content.decode("utf-8", "ignore"))
+        except (SyntaxError, ValueError):
+            # Fallback to regex for files with syntax errors
+            imports.update(
+                name.decode("ascii") for name in _PY_IMPORT_RE.findall(content)
+            )
+            return imports
+
+    # Walk statements only; expression subtrees, the bulk of any AST, can never
+    # contain an import
+    stack = list(tree.body)
+    while stack:
+        node = stack.pop()
+        if isinstance(node, ast.Import):
+            for alias in node.names:
+                imports.add(alias.name.split(".")[0])
+        elif isinstance(node, ast.ImportFrom):
+            if node.module:
+                imports.add(node.module.split(".")[0])
+        else:
+            for block in _STATEMENT_BLOCK_FIELDS:
+                stack.extend(getattr(node, block, ()))
+    return imports
+
+
+def find_orphaned_python_deps(index: RepoIndex) -> List[Dict]:
     """Find Python packages in requirements that are never imported."""
+    repo_path = index.root
     orphans = []
 
     # Find all imports in Python files
+    # AST parsing is CPU-bound, so large repos parse across processes
     all_imports = set()
-    for root, dirs, files in os.walk(repo_path):
-        dirs[:] = [
-            d
-            for d in dirs
-            if not d.startswith(".")
-            and d
-            not in ["node_modules", "venv", "__pycache__", "dist", "build", "target"]
-        ]
-
-        for file in files:
-            if file.endswith(".py"):
-                filepath = os.path.join(root, file)
-                try:
-                    with open(filepath, "r", encoding="utf-8", errors="ignore") as f:
-                        content = f.read()
-                    try:
-                        tree = ast.parse(content)
-                        for node in ast.walk(tree):
-                            if isinstance(node, ast.Import):
-                                for alias in node.names:
-                                    all_imports.add(alias.name.split(".")[0])
-                            elif isinstance(node, ast.ImportFrom):
-                                if node.module:
-                                    all_imports.add(node.module.split(".")[0])
-                    except SyntaxError:
-                        # Fallback to regex for files with syntax errors
-                        imports = re.findall(
-                            r"^(?:from|import)\s+(\w+)", content, re.MULTILINE
-                        )
-                        all_imports.update(imports)
-                except (IOError, OSError):
-                    continue
+    import_sets = None
+    if len(index.py_files) >= PARALLEL_PARSE_THRESHOLD:
+        try:
+            with ProcessPoolExecutor() as executor:
+                import_sets = list(
+                    executor.map(extract_python_imports, index.py_files, chunksize=64)
+                )
+        except (OSError, BrokenProcessPool, pickle.PicklingError):
+            # Process pools are unavailable in some sandboxes; parse serially
+            import_sets = None
+    if import_sets is None:
+        import_sets = map(extract_python_imports, index.py_files)
+    for imports in import_sets:
+        all_imports.update(imports)
+
+    # Normalized lookup sets so each requirement is a constant-time check
+    lower_imports = {imp.lower() for imp in all_imports}
+    normalized_imports = {imp.replace("-", "_") for imp in lower_imports}
 
     # Parse requirements files
     for req_file in [
@@ -471,16 +797,14 @@ def find_orphaned_python_deps(repo_path: str) -> List[Dict]:
                             and not line.startswith("-")
                         ):
                             # Extract package name (before ==, >=, etc.)
-                            pkg = re.split(r"[=<>!~\[\]]", line)[0].strip()
+                            pkg = _REQ_SPEC_SPLIT_RE.split(line)[0].strip()
                             # Normalize package name (- to _)
                             pkg_normalized = pkg.replace("-", "_").lower()
 
                             # Check if imported (accounting for name differences)
-                            imported = any(
-                                imp.lower() == pkg_normalized
-                                or imp.lower() == pkg.lower()
-                                or imp.lower().replace("-", "_") == pkg_normalized
-                                for imp in all_imports
+                            imported = (
+                                pkg_normalized in normalized_imports
+                                or pkg.lower() in lower_imports
                             )
 
                             if not imported and pkg:
@@ -494,7 +818,7 @@ def find_orphaned_python_deps(repo_path: str) -> List[Dict]:
                                         "confidence": 65,
                                         "reason": "package_not_imported",
                                         "gratitude": generate_gratitude(
-                                            "dependency", pkg, 0
+                                            "dependency", pkg
                                         ),
                                     }
                                 )
@@ -504,61 +828,38 @@ def find_orphaned_python_deps(repo_path: str) -> List[Dict]:
     return orphans
 
 
-def find_orphaned_js_deps(repo_path: str) -> List[Dict]:
+def find_orphaned_js_deps(index: RepoIndex) -> List[Dict]:
     """Find npm packages in package.json that are never imported."""
     orphans = []
 
-    package_json_path = os.path.join(repo_path, "package.json")
-    if not os.path.exists(package_json_path):
-        return orphans
-
-    try:
-        with open(package_json_path, "r", encoding="utf-8") as f:
-            pkg_data = json.load(f)
-    except (IOError, json.JSONDecodeError):
+    pkg_data = index.package_json
+    if pkg_data is None:
         return orphans
 
     # Collect all declared dependencies
     declared_deps = set()
     for dep_type in ["dependencies", "devDependencies", "peerDependencies"]:
         if dep_type in pkg_data:
-            declared_deps.update(pkg_data[dep_type].keys())
+            declared_deps.update(pkg_data[dep_type])
 
     # Find all imports in JS/TS files
     all_imports = set()
-    import_patterns = [
-        r'require\([\'"]([^\'"\./][^\'"]*?)[\'"]\)',  # require('package')
-        r'from\s+[\'"]([^\'"\./][^\'"]*?)[\'"]',  # from 'package'
-        r'import\s+[\'"]([^\'"\./][^\'"]*?)[\'"]',  # import 'package'
-    ]
-
-    for root, dirs, files in os.walk(repo_path):
-        dirs[:] = [
-            d
-            for d in dirs
-            if not d.startswith(".")
-            and d
-            not in ["node_modules", "venv", "__pycache__", "dist", "build", "target"]
-        ]
-
-        for file in files:
-            if file.endswith((".js", ".jsx", ".ts", ".tsx", ".mjs", ".cjs")):
-                filepath = os.path.join(root, file)
-                try:
-                    with open(filepath, "r", encoding="utf-8", errors="ignore") as f:
-                        content = f.read()
-                    for pattern in import_patterns:
-                        matches = re.findall(pattern, content)
-                        for match in matches:
-                            # Get base package name (e.g., @scope/package or package)
-                            if match.startswith("@"):
-                                parts = match.split("/")
-                                if len(parts) >= 2:
-                                    all_imports.add("/".join(parts[:2]))
-                            else:
-                                all_imports.add(match.split("/")[0])
-                except (IOError, OSError):
-                    continue
+    for filepath in index.js_files:
+        try:
+            with open(filepath, "rb") as f:
+                content = f.read()
+            for pattern in _JS_IMPORT_RES:
+                for raw_match in pattern.findall(content):
+                    match = raw_match.decode("utf-8", "replace")
+                    # Get base package name (e.g., @scope/package or package)
+                    if match[0] == "@":
+                        scope, _, rest = match.partition("/")
+                        if rest:
+                            all_imports.add(scope + "/" + rest.partition("/")[0])
+                    else:
+                        all_imports.add(match.partition("/")[0])
+        except (IOError, OSError):
+            continue
 
     # Find orphaned packages
     for pkg in declared_deps:
@@ -572,15 +873,16 @@ def find_orphaned_js_deps(repo_path: str) -> List[Dict]:
                     "category_name": "Dependencies (Books)",
                     "confidence": 60,  # Lower confidence - build tools often not directly imported
                     "reason": "package_not_imported",
-                    "gratitude": generate_gratitude("dependency", pkg, 0),
+                    "gratitude": generate_gratitude("dependency", pkg),
                 }
             )
 
     return orphans
 
 
-def find_orphaned_go_deps(repo_path: str) -> List[Dict]:
+def find_orphaned_go_deps(index: RepoIndex) -> List[Dict]:
     """Find Go modules in go.mod that are never imported."""
+    repo_path = index.root
     orphans = []
 
     go_mod_path = os.path.join(repo_path, "go.mod")
@@ -590,43 +892,40 @@ def find_orphaned_go_deps(repo_path: str) -> List[Dict]:
     # Parse go.mod for requires
     declared_deps = set()
     try:
-        with open(go_mod_path, "r", encoding="utf-8") as f:
-            content = f.read()
-        # Match require blocks and single requires
-        requires = re.findall(r"require\s+(\S+)\s+v", content)
-        requires.extend(re.findall(r"^\s+(\S+)\s+v", content, re.MULTILINE))
-        declared_deps.update(requires)
+        with mapped_file(go_mod_path) as content:
+            # Match require blocks and single requires
+            requires = _GO_REQUIRE_RE.findall(content)
+            requires.extend(_GO_REQUIRE_BLOCK_RE.findall(content))
+        declared_deps.update(req.decode("utf-8", "replace") for req in requires)
     except (IOError, OSError):
         return orphans
 
     # Find all imports in Go files
     all_imports = set()
-    for root, dirs, files in os.walk(repo_path):
-        dirs[:] = [
-            d
-            for d in dirs
-            if not d.startswith(".") and d not in ["vendor", ".git", "node_modules"]
-        ]
-
-        for file in files:
-            if file.endswith(".go"):
-                filepath = os.path.join(root, file)
-                try:
-                    with open(filepath, "r", encoding="utf-8", errors="ignore") as f:
-                        content = f.read()
-                    imports = re.findall(
-                        r'import\s+(?:\(\s*)?["\']([^"\']+)["\']', content
-                    )
-                    imports.extend(
-                        re.findall(r'^\s+["\']([^"\']+)["\']', content, re.MULTILINE)
-                    )
-                    all_imports.update(imports)
-                except (IOError, OSError):
-                    continue
+    for filepath in index.go_files:
+        try:
+            with open(filepath, "rb") as f:
+                content = f.read()
+            imports = _GO_IMPORT_RE.findall(content)
+            imports.extend(_GO_IMPORT_BLOCK_RE.findall(content))
+            all_imports.update(imp.decode("utf-8", "replace") for imp in imports)
+        except (IOError, OSError):
+            continue
+
+    # Every "/"-aligned tail of every import, sorted, so "some import starts
+    # with or contains mod" becomes a binary search for a tail starting with mod
+    import_tails = sorted(
+        {
+            "/".join(parts[i:])
+            for parts in (imp.split("/") for imp in all_imports)
+            for i in range(len(parts))
+        }
+    )
 
     # Find orphaned modules
     for mod in declared_deps:
-        if not any(imp.startswith(mod) or mod in imp for imp in all_imports):
+        pos = bisect.bisect_left(import_tails, mod)
+        if pos == len(import_tails) or not import_tails[pos].startswith(mod):
             orphans.append(
                 {
                     "package": mod,
@@ -636,15 +935,16 @@ def find_orphaned_go_deps(repo_path: str) -> List[Dict]:
                     "category_name": "Dependencies (Books)",
                     "confidence": 65,
                     "reason": "module_not_imported",
-                    "gratitude": generate_gratitude("dependency", mod, 0),
+                    "gratitude": generate_gratitude("dependency", mod),
                 }
             )
 
     return orphans
 
 
-def find_orphaned_rust_deps(repo_path: str) -> List[Dict]:
+def find_orphaned_rust_deps(index: RepoIndex) -> List[Dict]:
     """Find Rust crates in Cargo.toml that are never used."""
+    repo_path = index.root
     orphans = []
 
     cargo_path = os.path.join(repo_path, "Cargo.toml")
@@ -654,46 +954,37 @@ def find_orphaned_rust_deps(repo_path: str) -> List[Dict]:
     # Parse Cargo.toml for dependencies
     declared_deps = set()
     try:
-        with open(cargo_path, "r", encoding="utf-8") as f:
-            content = f.read()
-        # Simple TOML parsing for dependencies
+        # Simple TOML parsing for dependencies, streamed line by line
         in_deps = False
-        for line in content.split("\n"):
-            if re.match(r"\[(.*dependencies.*)\]", line):
-                in_deps = True
-                continue
-            if line.startswith("[") and in_deps:
-                in_deps = False
-            if in_deps and "=" in line:
-                crate = line.split("=")[0].strip()
-                if crate and not crate.startswith("#"):
-                    declared_deps.add(crate)
+        with open(cargo_path, "r", encoding="utf-8") as f:
+            for line in f:
+                line = line.rstrip("\n")
+                if _CARGO_DEPS_HEADER_RE.match(line):
+                    in_deps = True
+                    continue
+                if line.startswith("[") and in_deps:
+                    in_deps = False
+                if in_deps and "=" in line:
+                    crate = line.split("=")[0].strip()
+                    if crate and not crate.startswith("#"):
+                        declared_deps.add(crate)
     except (IOError, OSError):
         return orphans
 
     # Find all uses in Rust files
     all_uses = set()
-    for root, dirs, files in os.walk(repo_path):
-        dirs[:] = [
-            d
-            for d in dirs
-            if not d.startswith(".") and d not in ["target", "node_modules"]
-        ]
-
-        for file in files:
-            if file.endswith(".rs"):
-                filepath = os.path.join(root, file)
-                try:
-                    with open(filepath, "r", encoding="utf-8", errors="ignore") as f:
-                        content = f.read()
-                    # Match use statements and extern crate
-                    uses = re.findall(r"use\s+(\w+)", content)
-                    uses.extend(re.findall(r"extern\s+crate\s+(\w+)", content))
-                    # Also check for crate:: references
-                    uses.extend(re.findall(r"(\w+)::", content))
-                    all_uses.update(uses)
-                except (IOError, OSError):
-                    continue
+    for filepath in index.rust_files:
+        try:
+            with open(filepath, "rb") as f:
+                content = f.read()
+            # Match use statements and extern crate
+            uses = _RUST_USE_RE.findall(content)
+            uses.extend(_RUST_EXTERN_RE.findall(content))
+            # Also check for crate:: references
+            uses.extend(_RUST_PATH_RE.findall(content))
+            all_uses.update(use.decode("ascii") for use in uses)
+        except (IOError, OSError):
+            continue
 
     # Find orphaned crates
     for crate in declared_deps:
@@ -709,26 +1000,26 @@ def find_orphaned_rust_deps(repo_path: str) -> List[Dict]:
                     "category_name": "Dependencies (Books)",
                     "confidence": 65,
                     "reason": "crate_not_used",
-                    "gratitude": generate_gratitude("dependency", crate, 0),
+                    "gratitude": generate_gratitude("dependency", crate),
                 }
             )
 
     return orphans
 
 
-def find_all_orphaned_deps(repo_path: str) -> List[Dict]:
+def find_all_orphaned_deps(index: RepoIndex) -> List[Dict]:
     """Find orphaned dependencies across all detected ecosystems."""
-    ecosystems = detect_ecosystems(repo_path)
+    ecosystems = detect_ecosystems(index)
     all_orphans = []
 
     if "python" in ecosystems:
-        all_orphans.extend(find_orphaned_python_deps(repo_path))
+        all_orphans.extend(find_orphaned_python_deps(index))
     if "javascript" in ecosystems:
-        all_orphans.extend(find_orphaned_js_deps(repo_path))
+        all_orphans.extend(find_orphaned_js_deps(index))
     if "go" in ecosystems:
-        all_orphans.extend(find_orphaned_go_deps(repo_path))
+        all_orphans.extend(find_orphaned_go_deps(index))
     if "rust" in ecosystems:
-        all_orphans.extend(find_orphaned_rust_deps(repo_path))
+        all_orphans.extend(find_orphaned_rust_deps(index))
 
     return all_orphans
 
@@ -737,101 +1028,85 @@ def find_all_orphaned_deps(repo_path: str) -> List[Dict]:
 # CATEGORY 3: DOCUMENTATION ANALYSIS
 # =============================================================================
 
+# Pattern: [text](path) or [text](./path)
+_MD_LINK_RE = re.compile(r"\[([^\]]+)\]\((?:\./)?([^)#]+?)(?:#[^)]*)?\)")
+_CODE_BLOCK_RE = re.compile(r"```(\w+\.\w+)")
+
+
+def find_broken_references(
+    doc: RepoFile, existing_rel: Set[str], existing_names: Set[str]
+) -> List[Dict]:
+    """List a document's links and code block files that point at missing files."""
+    content = read_text(doc.path, doc.size)
+
+    broken_refs = []
+    # Links resolve relative to the directory holding the document
+    doc_dir = os.path.dirname(doc.path)
+    doc_rel_dir = os.path.dirname(doc.rel_path)
+
+    # Check markdown links to local files
+    md_links = _MD_LINK_RE.findall(content)
+    for link_text, link_path in md_links:
+        if not link_path.startswith(("http://", "https://", "mailto:")):
+            # Resolving against the document's repo-relative directory gives
+            # the same key as relpath() on the absolute target, without its
+            # abspath work; only set misses (directories, skipped or outside
+            # paths) are checked on disk
+            rel_to_repo = os.path.normpath(os.path.join(doc_rel_dir, link_path))
+            if rel_to_repo not in existing_rel and not os.path.exists(
+                os.path.normpath(os.path.join(doc_dir, link_path))
+            ):
+                broken_refs.append(
+                    {
+                        "type": "broken_link",
+                        "reference": link_path,
+                        "link_text": link_text,
+                    }
+                )
 
-def find_documentation_drift(repo_path: str) -> List[Dict]:
-    """Find documentation that references non-existent files or functions."""
-    drift_issues = []
-
-    # Collect all existing file paths
-    existing_files = set()
-    for root, dirs, files in os.walk(repo_path):
-        dirs[:] = [
-            d
-            for d in dirs
-            if not d.startswith(".")
-            and d
-            not in ["node_modules", "venv", "__pycache__", "dist", "build", "target"]
-        ]
-        for file in files:
-            rel_path = os.path.relpath(os.path.join(root, file), repo_path)
-            existing_files.add(rel_path)
-            existing_files.add(os.path.basename(file))
-
-    # Find markdown files
-    for root, dirs, files in os.walk(repo_path):
-        dirs[:] = [
-            d
-            for d in dirs
-            if not d.startswith(".")
-            and d not in ["node_modules", "venv", "__pycache__", "dist", "build"]
-        ]
-
-        for file in files:
-            if file.endswith((".md", ".rst", ".txt")) and not file.startswith("."):
-                filepath = os.path.join(root, file)
-                rel_path = os.path.relpath(filepath, repo_path)
-
-                try:
-                    with open(filepath, "r", encoding="utf-8", errors="ignore") as f:
-                        content = f.read()
+    # Check code block references (```filename or <!-- include: file -->)
+    code_refs = _CODE_BLOCK_RE.findall(content)
+    for ref in code_refs:
+        if ref not in existing_names:
+            broken_refs.append({"type": "code_block_file", "reference": ref})
 
-                    broken_refs = []
+    return broken_refs
 
-                    # Check markdown links to local files
-                    # Pattern: [text](path) or [text](./path)
-                    md_links = re.findall(
-                        r"\[([^\]]+)\]\((?:\./)?([^)#]+?)(?:#[^)]*)?\)", content
-                    )
-                    for link_text, link_path in md_links:
-                        if not link_path.startswith(("http://", "https://", "mailto:")):
-                            # Resolve relative path
-                            doc_dir = os.path.dirname(filepath)
-                            full_path = os.path.normpath(
-                                os.path.join(doc_dir, link_path)
-                            )
-                            rel_to_repo = os.path.relpath(full_path, repo_path)
 
-                            if (
-                                not os.path.exists(full_path)
-                                and rel_to_repo not in existing_files
-                            ):
-                                broken_refs.append(
-                                    {
-                                        "type": "broken_link",
-                                        "reference": link_path,
-                                        "link_text": link_text,
-                                    }
-                                )
+def find_documentation_drift(index: RepoIndex) -> List[Dict]:
+    """Find documentation that references non-existent files or functions."""
+    drift_issues = []
 
-                    # Check code block references (```filename or <!-- include: file -->)
-                    code_refs = re.findall(r"```(\w+\.\w+)", content)
-                    for ref in code_refs:
-                        if ref not in existing_files:
-                            broken_refs.append(
-                                {"type": "code_block_file", "reference": ref}
-                            )
+    # Links are resolved against repo-relative paths, code block references
+    # against bare filenames
+    existing_rel = set()
+    existing_names = set()
+    for f in index.files:
+        existing_rel.add(f.rel_path)
+        existing_names.add(f.name)
+
+    docs = [f for f in index.md_files if f.mtime is not None]
+    scan = partial(
+        find_broken_references,
+        existing_rel=existing_rel,
+        existing_names=existing_names,
+    )
 
-                    if broken_refs:
-                        stat = os.stat(filepath)
-                        drift_issues.append(
-                            {
-                                "path": rel_path,
-                                "broken_references": broken_refs[:5],  # Limit to 5
-                                "broken_count": len(broken_refs),
-                                "modified": datetime.fromtimestamp(
-                                    stat.st_mtime
-                                ).strftime("%Y-%m-%d"),
-                                "category": "documentation",
-                                "category_name": "Documentation (Papers)",
-                                "confidence": min(40 + len(broken_refs) * 10, 80),
-                                "reason": "documentation_drift",
-                                "gratitude": generate_gratitude(
-                                    "documentation", rel_path, 0
-                                ),
-                            }
-                        )
-                except (IOError, OSError):
-                    continue
+    for doc, broken_refs in zip(docs, map_files(scan, docs)):
+        if broken_refs:
+            drift_issues.append(
+                {
+                    "path": doc.rel_path,
+                    "broken_references": broken_refs[:5],  # Limit to 5
+                    "broken_count": len(broken_refs),
+                    "modified": time.strftime("%Y-%m-%d", time.localtime(doc.mtime)),
+                    "category": "documentation",
+                    "category_name": "Documentation (Papers)",
+                    "confidence": min(40 + len(broken_refs) * 10, 80),
+                    "reason": "documentation_drift",
+                    "gratitude": generate_gratitude("documentation", doc.rel_path),
+                }
+            )
 
     return drift_issues
 
@@ -841,87 +1116,80 @@ def find_documentation_drift(repo_path: str) -> List[Dict]:
 # =============================================================================
 
 
-def find_orphaned_configs(repo_path: str) -> List[Dict]:
+CONFIG_PATTERNS = [
+    # Build tool configs without corresponding tools
+    (r"\.babelrc$", "babel", ["package.json"]),
+    (r"webpack\.config\.js$", "webpack", ["package.json"]),
+    (r"rollup\.config\.js$", "rollup", ["package.json"]),
+    (r"jest\.config\.(js|ts|json)$", "jest", ["package.json"]),
+    (r"\.eslintrc.*$", "eslint", ["package.json"]),
+    (r"\.prettierrc.*$", "prettier", ["package.json"]),
+    (r"tsconfig.*\.json$", "typescript", ["package.json"]),
+    # Python configs
+    (r"setup\.cfg$", "setuptools", ["setup.py", "pyproject.toml"]),
+    (r"\.pylintrc$", "pylint", ["requirements.txt", "pyproject.toml"]),
+    (r"\.flake8$", "flake8", ["requirements.txt", "pyproject.toml"]),
+    (r"mypy\.ini$", "mypy", ["requirements.txt", "pyproject.toml"]),
+    # CI/CD configs (check if referenced tools exist)
+    (r"\.travis\.yml$", "travis", []),
+    (r"\.circleci/config\.yml$", "circleci", []),
+    (r"Jenkinsfile$", "jenkins", []),
+]
+
+_CONFIG_PATTERN_RES = [
+    (re.compile(pattern), tool_name, dep_files)
+    for pattern, tool_name, dep_files in CONFIG_PATTERNS
+]
+# Used while walking to pick out candidate config files
+_CONFIG_ANY_RE = re.compile("|".join(f"(?:{p})" for p, _, _ in CONFIG_PATTERNS))
+
+
+def find_orphaned_configs(index: RepoIndex) -> List[Dict]:
     """Find configuration files that may be orphaned or outdated."""
+    repo_path = index.root
     orphans = []
 
-    config_patterns = [
-        # Build tool configs without corresponding tools
-        (r"\.babelrc$", "babel", ["package.json"]),
-        (r"webpack\.config\.js$", "webpack", ["package.json"]),
-        (r"rollup\.config\.js$", "rollup", ["package.json"]),
-        (r"jest\.config\.(js|ts|json)$", "jest", ["package.json"]),
-        (r"\.eslintrc.*$", "eslint", ["package.json"]),
-        (r"\.prettierrc.*$", "prettier", ["package.json"]),
-        (r"tsconfig.*\.json$", "typescript", ["package.json"]),
-        # Python configs
-        (r"setup\.cfg$", "setuptools", ["setup.py", "pyproject.toml"]),
-        (r"\.pylintrc$", "pylint", ["requirements.txt", "pyproject.toml"]),
-        (r"\.flake8$", "flake8", ["requirements.txt", "pyproject.toml"]),
-        (r"mypy\.ini$", "mypy", ["requirements.txt", "pyproject.toml"]),
-        # CI/CD configs (check if referenced tools exist)
-        (r"\.travis\.yml$", "travis", []),
-        (r"\.circleci/config\.yml$", "circleci", []),
-        (r"Jenkinsfile$", "jenkins", []),
-    ]
-
     # Get list of installed packages if package.json exists
     installed_packages = set()
-    pkg_json_path = os.path.join(repo_path, "package.json")
-    if os.path.exists(pkg_json_path):
-        try:
-            with open(pkg_json_path, "r") as f:
-                pkg = json.load(f)
-            for dep_type in ["dependencies", "devDependencies"]:
-                if dep_type in pkg:
-                    installed_packages.update(pkg[dep_type].keys())
-        except (IOError, json.JSONDecodeError):
-            pass
-
-    for root, dirs, files in os.walk(repo_path):
-        dirs[:] = [
-            d
-            for d in dirs
-            if not d.startswith(".")
-            and d
-            not in ["node_modules", "venv", "__pycache__", "dist", "build", "target"]
-        ]
-
-        for file in files:
-            for pattern, tool_name, dep_files in config_patterns:
-                if re.match(pattern, file):
-                    filepath = os.path.join(root, file)
-                    rel_path = os.path.relpath(filepath, repo_path)
-
-                    # Check if tool is installed
-                    tool_installed = tool_name in installed_packages
-
-                    # Check if any dependency files exist
-                    has_dep_files = any(
-                        os.path.exists(os.path.join(repo_path, df)) for df in dep_files
-                    )
+    pkg = index.package_json
+    if pkg is not None:
+        for dep_type in ["dependencies", "devDependencies"]:
+            if dep_type in pkg:
+                installed_packages.update(pkg[dep_type].keys())
+
+    # The dependency files are a handful of fixed root-level names; stat each
+    # once here instead of once per matching config file
+    all_dep_files = {df for _, _, deps in CONFIG_PATTERNS for df in deps}
+    dep_present = {
+        df for df in all_dep_files if os.path.exists(os.path.join(repo_path, df))
+    }
 
-                    if not tool_installed and not has_dep_files and dep_files:
-                        try:
-                            stat = os.stat(filepath)
-                            age_days = calculate_age_days(stat.st_mtime)
-
-                            orphans.append(
-                                {
-                                    "path": rel_path,
-                                    "tool": tool_name,
-                                    "age_days": age_days,
-                                    "category": "configuration",
-                                    "category_name": "Configuration (Komono)",
-                                    "confidence": 55 + (15 if age_days > 90 else 0),
-                                    "reason": "orphaned_config",
-                                    "gratitude": generate_gratitude(
-                                        "config", tool_name, age_days
-                                    ),
-                                }
-                            )
-                        except OSError:
-                            continue
+    for rel_path, name, _, _, mtime in index.config_files:
+        for pattern, tool_name, dep_files in _CONFIG_PATTERN_RES:
+            if pattern.match(name):
+                # Check if tool is installed
+                tool_installed = tool_name in installed_packages
+
+                # Check if any dependency files exist
+                has_dep_files = any(df in dep_present for df in dep_files)
+
+                if not tool_installed and not has_dep_files and dep_files:
+                    if mtime is None:
+                        continue
+                    age_days = calculate_age_days(mtime, index.scanned_at)
+
+                    orphans.append(
+                        {
+                            "path": rel_path,
+                            "tool": tool_name,
+                            "age_days": age_days,
+                            "category": "configuration",
+                            "category_name": "Configuration (Komono)",
+                            "confidence": 55 + (15 if age_days > 90 else 0),
+                            "reason": "orphaned_config",
+                            "gratitude": generate_gratitude("config", tool_name),
+                        }
+                    )
 
     return orphans
 
@@ -931,73 +1199,91 @@ def find_orphaned_configs(repo_path: str) -> List[Dict]:
 # =============================================================================
 
 
-def find_legacy_code(repo_path: str) -> List[Dict]:
+# Look for deprecation markers (must be in actual comments, not strings)
+# Pattern: comment character followed by optional whitespace, then marker
+# More specific patterns to avoid false positives from regex patterns and section headers
+COMMENT_DEPRECATION_PATTERNS = [
+    (r"@\s*deprecated", "python"),
+    (r"//.*@\s*deprecated", "js"),
+    (r"/\*.*@\s*deprecated.*\*/", "js"),
+    (r"#\s*DEPRECATED[:\s]", "python"),
+    (r"//\s*DEPRECATED[:\s]", "js"),
+    (r"/\*\s*DEPRECATED[:\s].*\*/", "js"),
+    (r"#\s*LEGACY[:\s]", "python"),
+    (r"//\s*LEGACY[:\s]", "js"),
+    (r"TODO[:\s].*remove", "python"),
+    (r"FIXME[:\s].*remove", "python"),
+]
+
+_DEPRECATION_RES = [
+    (re.compile(pattern, re.IGNORECASE), lang)
+    for pattern, lang in COMMENT_DEPRECATION_PATTERNS
+]
+# Most files carry no markers at all; one pass with the combined alternation
+# rules them out before the per-pattern scans, which can overlap and are
+# capped separately.
+_DEPRECATION_ANY_RE = re.compile(
+    "|".join(f"(?:{p})" for p, _ in COMMENT_DEPRECATION_PATTERNS), re.IGNORECASE
+)
+
+
+# Larger source files are generated or vendored bundles, not code to review
+MAX_LEGACY_SCAN_BYTES = 2_000_000
+
+# A NUL byte this close to the start marks a file as binary
+BINARY_SNIFF_BYTES = 4096
+
+
+def find_deprecation_markers(source: RepoFile) -> List[str]:
+    """Collect up to three matches per deprecation pattern from a source file."""
+    if source.size > MAX_LEGACY_SCAN_BYTES:
+        return []
+
+    with open(source.path, "rb", buffering=0) as f:
+        # Sniff the head first so a binary file costs one small read
+        raw = f.read(BINARY_SNIFF_BYTES)
+        if b"\x00" in raw:
+            return []
+        # A short first read has already reached the end of the file
+        if len(raw) == BINARY_SNIFF_BYTES:
+            raw += f.readall()
+    content = decode_text(raw)
+
+    deprecation_markers = []
+    if _DEPRECATION_ANY_RE.search(content):
+        for pattern, lang in _DEPRECATION_RES:
+            # Only the first three matches per pattern are kept, so stop there
+            for match in itertools.islice(pattern.finditer(content), 3):
+                deprecation_markers.append(match.group(0))
+    return deprecation_markers
+
+
+def find_legacy_code(index: RepoIndex) -> List[Dict]:
     """Find potentially legacy code that needs human judgment."""
     legacy_items = []
 
-    # Look for deprecation markers (must be in actual comments, not strings)
-    # Pattern: comment character followed by optional whitespace, then marker
-    # More specific patterns to avoid false positives from regex patterns and section headers
-    comment_deprecation_patterns = [
-        (r"@\s*deprecated", "python"),
-        (r"//.*@\s*deprecated", "js"),
-        (r"/\*.*@\s*deprecated.*\*/", "js"),
-        (r"#\s*DEPRECATED[:\s]", "python"),
-        (r"//\s*DEPRECATED[:\s]", "js"),
-        (r"/\*\s*DEPRECATED[:\s].*\*/", "js"),
-        (r"#\s*LEGACY[:\s]", "python"),
-        (r"//\s*LEGACY[:\s]", "js"),
-        (r"TODO[:\s].*remove", "python"),
-        (r"FIXME[:\s].*remove", "python"),
-    ]
+    sources = [f for f in index.code_files if f.mtime is not None]
+    scans = map_files(find_deprecation_markers, sources)
 
-    for root, dirs, files in os.walk(repo_path):
-        dirs[:] = [
-            d
-            for d in dirs
-            if not d.startswith(".")
-            and d
-            not in ["node_modules", "venv", "__pycache__", "dist", "build", "target"]
-        ]
-
-        for file in files:
-            if file.endswith(
-                (".py", ".js", ".ts", ".jsx", ".tsx", ".go", ".rs", ".java")
-            ):
-                filepath = os.path.join(root, file)
-                rel_path = os.path.relpath(filepath, repo_path)
+    for source, deprecation_markers in zip(sources, scans):
+        if deprecation_markers:
+            age_days = calculate_age_days(source.mtime, index.scanned_at)
 
-                try:
-                    with open(filepath, "r", encoding="utf-8", errors="ignore") as f:
-                        content = f.read()
-
-                    deprecation_markers = []
-                    for pattern, lang in comment_deprecation_patterns:
-                        matches = re.findall(pattern, content, re.IGNORECASE)
-                        if matches:
-                            deprecation_markers.extend(matches[:3])
-
-                    if deprecation_markers:
-                        stat = os.stat(filepath)
-                        age_days = calculate_age_days(stat.st_mtime)
-
-                        legacy_items.append(
-                            {
-                                "path": rel_path,
-                                "markers": list(set(deprecation_markers))[:5],
-                                "marker_count": len(deprecation_markers),
-                                "age_days": age_days,
-                                "category": "legacy",
-                                "category_name": "Legacy Code (Sentimental)",
-                                "confidence": 40,  # Low confidence - needs human review
-                                "reason": "contains_deprecation_markers",
-                                "gratitude": generate_gratitude(
-                                    "legacy", rel_path, age_days
-                                ),
-                            }
-                        )
-                except (IOError, OSError):
-                    continue
+            legacy_items.append(
+                {
+                    "path": source.rel_path,
+                    # dict.fromkeys dedupes in first-seen order, keeping output
+                    # stable across runs (set order depends on hash seeding)
+                    "markers": list(dict.fromkeys(deprecation_markers))[:5],
+                    "marker_count": len(deprecation_markers),
+                    "age_days": age_days,
+                    "category": "legacy",
+                    "category_name": "Legacy Code (Sentimental)",
+                    "confidence": 40,  # Low confidence - needs human review
+                    "reason": "contains_deprecation_markers",
+                    "gratitude": generate_gratitude("legacy", source.rel_path),
+                }
+            )
 
     return sorted(legacy_items, key=lambda x: x["marker_count"], reverse=True)[:15]
 
@@ -1007,58 +1293,59 @@ def find_legacy_code(repo_path: str) -> List[Dict]:
 # =============================================================================
 
 
-def analyze_commits(repo_path: str, days: int = 90) -> Dict:
+def analyze_commits(
+    repo_path: str, days: int = 90, git_cache: Optional[Dict[str, bool]] = None
+) -> Dict:
     """Analyze recent commits for AI-generated patterns."""
-    if not is_git_repo(repo_path):
+    if not is_git_repo(repo_path, git_cache):
         return {"has_git": False, "ai_commits": [], "ai_signed_commits": []}
 
     since_date = (datetime.now() - timedelta(days=days)).strftime("%Y-%m-%d")
 
-    # Get commit log with full message
-    log_output = run_git_command(
+    # Stream the commit log with full messages, one commit at a time. Commits
+    # are NUL-separated (-z) and fields split on the ASCII unit separator, so
+    # "|" or any other ordinary text in a message can't break the parse.
+    log_entries = iter_git_records(
         [
             "git",
             "log",
             f"--since={since_date}",
-            "--pretty=format:%H|%s|%ai|%an|%b<<<END>>>",
+            "-z",
+            "--pretty=format:%H%x1f%s%x1f%ai%x1f%an%x1f%b",
         ],
-        cwd=repo_path,
+        repo_path,
+        b"\x00",
     )
 
-    if not log_output:
-        return {
-            "has_git": True,
-            "ai_commits": [],
-            "ai_signed_commits": [],
-            "total_commits": 0,
-        }
-
     ai_commits = []
     ai_signed_commits = []
     total_commits = 0
+    has_log = False
 
-    for entry in log_output.split("<<<END>>>"):
-        entry = entry.strip()
-        if not entry:
-            continue
-
-        parts = entry.split("|", 4)
+    for entry in log_entries:
+        has_log = True
+        parts = entry.split(b"\x1f", 4)
         if len(parts) < 4:
             continue
 
         total_commits += 1
-        commit_hash, subject, date, author = parts[0], parts[1], parts[2], parts[3]
-        body = parts[4] if len(parts) > 4 else ""
+        # Only the subject and body are always needed; the rest is decoded
+        # for the few commits that get reported
+        raw_hash, raw_subject, raw_date, raw_author = parts[:4]
+        subject = raw_subject.decode("utf-8", "replace")
+        body = parts[4].decode("utf-8", "replace") if len(parts) > 4 else ""
         full_message = subject + "\n" + body
 
         # Check for AI tool signatures
-        if any(signature in full_message for signature in AI_COMMIT_SIGNATURES):
+        if any(stem in full_message for stem in _AI_SIGNATURE_STEMS) and any(
+            signature in full_message for signature in AI_COMMIT_SIGNATURES
+        ):
             ai_signed_commits.append(
                 {
-                    "hash": commit_hash[:8],
+                    "hash": raw_hash[:8].decode(),
                     "message": subject[:100],
-                    "date": date[:10],
-                    "author": author,
+                    "date": raw_date[:10].decode(),
+                    "author": raw_author.decode("utf-8", "replace"),
                     "is_ai_signed": True,
                 }
             )
@@ -1067,23 +1354,32 @@ def analyze_commits(repo_path: str, days: int = 90) -> Dict:
         # Check for AI patterns
         ai_score = 0
         matched_patterns = []
-        for pattern in AI_COMMIT_PATTERNS:
-            if re.search(pattern, subject, re.IGNORECASE):
-                ai_score += 1
-                matched_patterns.append(pattern)
+        if _AI_COMMIT_ANY_RE.search(subject):
+            for pattern, compiled in _AI_COMMIT_RES:
+                if compiled.search(subject):
+                    ai_score += 1
+                    matched_patterns.append(pattern)
 
         if ai_score >= 2:  # Require multiple pattern matches
             ai_commits.append(
                 {
-                    "hash": commit_hash[:8],
+                    "hash": raw_hash[:8].decode(),
                     "message": subject[:100],
-                    "date": date[:10],
-                    "author": author,
+                    "date": raw_date[:10].decode(),
+                    "author": raw_author.decode("utf-8", "replace"),
                     "ai_score": ai_score,
                     "patterns": matched_patterns[:3],
                 }
             )
 
+    if not has_log:
+        return {
+            "has_git": True,
+            "ai_commits": [],
+            "ai_signed_commits": [],
+            "total_commits": 0,
+        }
+
     return {
         "has_git": True,
         "total_commits": total_commits,
@@ -1097,26 +1393,32 @@ def analyze_commits(repo_path: str, days: int = 90) -> Dict:
     }
 
 
-def find_stale_branches(repo_path: str) -> List[Dict]:
+# Branch name prefixes, matched case-insensitively and reported as "^prefix"
+STALE_BRANCH_PREFIXES = (
+    "claude-",
+    "cursor-",
+    "copilot-",
+    "codex-",
+    "attempt-",
+    "test-",
+    "wip-",
+    "experimental-",
+    "try-",
+    "debug-",
+    "feature/wip-",
+)
+STALE_HOTFIX_PATTERN = r"^hotfix-\d{8}"  # Old dated hotfixes
+
+_STALE_HOTFIX_RE = re.compile(STALE_HOTFIX_PATTERN, re.IGNORECASE)
+
+
+def find_stale_branches(
+    repo_path: str, git_cache: Optional[Dict[str, bool]] = None
+) -> List[Dict]:
     """Find branches that may be stale or experimental."""
-    if not is_git_repo(repo_path):
+    if not is_git_repo(repo_path, git_cache):
         return []
 
-    stale_patterns = [
-        r"^claude-",
-        r"^cursor-",
-        r"^copilot-",
-        r"^codex-",
-        r"^attempt-",
-        r"^test-",
-        r"^wip-",
-        r"^experimental-",
-        r"^try-",
-        r"^debug-",
-        r"^feature/wip-",
-        r"^hotfix-\d{8}",  # Old dated hotfixes
-    ]
-
     branches_output = run_git_command(["git", "branch", "-a"], cwd=repo_path)
     if not branches_output:
         return []
@@ -1125,16 +1427,24 @@ def find_stale_branches(repo_path: str) -> List[Dict]:
     for branch in branches_output.split("\n"):
         branch = branch.strip().lstrip("* ").replace("remotes/origin/", "")
 
-        for pattern in stale_patterns:
-            if re.match(pattern, branch, re.IGNORECASE):
-                stale_branches.append(
-                    {
-                        "name": branch,
-                        "pattern": pattern,
-                        "reason": "matches_stale_pattern",
-                    }
-                )
-                break
+        # One startswith call checks every prefix; no prefix starts another,
+        # so at most one of them can match
+        lowered = branch.lower()
+        if lowered.startswith(STALE_BRANCH_PREFIXES):
+            prefix = next(p for p in STALE_BRANCH_PREFIXES if lowered.startswith(p))
+            pattern = "^" + prefix
+        elif _STALE_HOTFIX_RE.match(branch):
+            pattern = STALE_HOTFIX_PATTERN
+        else:
+            continue
+
+        stale_branches.append(
+            {
+                "name": branch,
+                "pattern": pattern,
+                "reason": "matches_stale_pattern",
+            }
+        )
 
     return stale_branches[:20]
 
@@ -1144,51 +1454,37 @@ def find_stale_branches(repo_path: str) -> List[Dict]:
 # =============================================================================
 
 
-def find_context_heavy_files(repo_path: str) -> List[Dict]:
+def find_context_heavy_files(index: RepoIndex) -> List[Dict]:
     """Find files that may bloat an AI assistant's context window."""
     heavy_files = []
 
-    for root, dirs, files in os.walk(repo_path):
-        dirs[:] = [
-            d
-            for d in dirs
-            if not d.startswith(".")
-            and d
-            not in ["node_modules", "venv", "__pycache__", "dist", "build", "target"]
-        ]
-
-        for file in files:
-            ext = Path(file).suffix.lower()
-            if ext not in CONTEXT_HEAVY_EXTENSIONS:
-                continue
-
-            filepath = os.path.join(root, file)
-            rel_path = os.path.relpath(filepath, repo_path)
-
-            try:
-                with open(filepath, "r", encoding="utf-8", errors="ignore") as f:
-                    content = f.read()
+    candidates = [
+        f
+        for f in index.heavy_files
+        if f.mtime is not None and f.size >= _MIN_HEAVY_BYTES
+    ]
+    line_counts = map_files(count_lines, [f.path for f in candidates])
 
-                lines = content.count("\n") + 1
-                tokens = estimate_tokens(content)
+    for (rel_path, _, _, size, _), lines in zip(candidates, line_counts):
+        if lines is None:
+            continue
+        tokens = estimate_tokens_from_size(size)
 
-                if lines > MAX_RECOMMENDED_LINES or tokens > MAX_RECOMMENDED_TOKENS:
-                    heavy_files.append(
-                        {
-                            "path": rel_path,
-                            "lines": lines,
-                            "estimated_tokens": tokens,
-                            "exceeds_lines": lines > MAX_RECOMMENDED_LINES,
-                            "exceeds_tokens": tokens > MAX_RECOMMENDED_TOKENS,
-                            "recommendation": "consider_splitting"
-                            if lines > 1000
-                            else "monitor",
-                            "category": "context_heavy",
-                            "confidence": 50,  # Not deletions, just recommendations
-                        }
-                    )
-            except (IOError, OSError):
-                continue
+        if lines > MAX_RECOMMENDED_LINES or tokens > MAX_RECOMMENDED_TOKENS:
+            heavy_files.append(
+                {
+                    "path": rel_path,
+                    "lines": lines,
+                    "estimated_tokens": tokens,
+                    "exceeds_lines": lines > MAX_RECOMMENDED_LINES,
+                    "exceeds_tokens": tokens > MAX_RECOMMENDED_TOKENS,
+                    "recommendation": "consider_splitting"
+                    if lines > 1000
+                    else "monitor",
+                    "category": "context_heavy",
+                    "confidence": 50,  # Not deletions, just recommendations
+                }
+            )
 
     return sorted(heavy_files, key=lambda x: x["estimated_tokens"], reverse=True)[:15]
 
@@ -1198,40 +1494,40 @@ def find_context_heavy_files(repo_path: str) -> List[Dict]:
 # =============================================================================
 
 
-def generate_gratitude(item_type: str, identifier: str, age_days: int) -> str:
-    """Generate a gratitude message for a file/item in KonMari spirit."""
-    templates = {
-        "dead_file": [
-            f"Thank you, {identifier}, for being part of this project's journey.",
-            f"Thank you for the work you represented. Your purpose has been fulfilled.",
-            f"Gratitude for {identifier} - you served your purpose during development.",
-        ],
-        "duplicate": [
-            f"Thank you for preserving a backup of {identifier}. That safety is no longer needed.",
-            f"Gratitude for being a safety net. Version control now provides this security.",
-        ],
-        "dependency": [
-            f"Thank you, {identifier}, for the capability you offered, even if unused.",
-            f"Gratitude for {identifier} - you taught us about available tools.",
-        ],
-        "documentation": [
-            f"Thank you, documentation, for attempting to guide future developers.",
-            f"Gratitude for documenting past understanding, even as the code evolved.",
-        ],
-        "config": [
-            f"Thank you, {identifier} configuration, for the tooling you once enabled.",
-            f"Gratitude for the development environment you helped create.",
-        ],
-        "legacy": [
-            f"Deep gratitude to this code for getting the project to where it is today.",
-            f"Thank you for the foundation you provided. Your lessons remain even as you go.",
-        ],
-    }
+GRATITUDE_TEMPLATES = {
+    "dead_file": (
+        "Thank you, {id}, for being part of this project's journey.",
+        "Thank you for the work you represented. Your purpose has been fulfilled.",
+        "Gratitude for {id} - you served your purpose during development.",
+    ),
+    "duplicate": (
+        "Thank you for preserving a backup of {id}. That safety is no longer needed.",
+        "Gratitude for being a safety net. Version control now provides this security.",
+    ),
+    "dependency": (
+        "Thank you, {id}, for the capability you offered, even if unused.",
+        "Gratitude for {id} - you taught us about available tools.",
+    ),
+    "documentation": (
+        "Thank you, documentation, for attempting to guide future developers.",
+        "Gratitude for documenting past understanding, even as the code evolved.",
+    ),
+    "config": (
+        "Thank you, {id} configuration, for the tooling you once enabled.",
+        "Gratitude for the development environment you helped create.",
+    ),
+    "legacy": (
+        "Deep gratitude to this code for getting the project to where it is today.",
+        "Thank you for the foundation you provided. Your lessons remain even as you go.",
+    ),
+}
+_DEFAULT_GRATITUDE = ("Thank you, {id}, for your service.",)
 
-    import random
 
-    choices = templates.get(item_type, [f"Thank you, {identifier}, for your service."])
-    return random.choice(choices)
+def generate_gratitude(item_type: str, identifier: str) -> str:
+    """Generate a gratitude message for a file/item in KonMari spirit."""
+    choices = GRATITUDE_TEMPLATES.get(item_type, _DEFAULT_GRATITUDE)
+    return random.choice(choices).format(id=identifier)
 
 
 # =============================================================================
@@ -1239,8 +1535,9 @@ def generate_gratitude(item_type: str, identifier: str, age_days: int) -> str:
 # =============================================================================
 
 
-def detect_monorepo(repo_path: str) -> Dict:
+def detect_monorepo(index: RepoIndex) -> Dict:
     """Detect if this is a monorepo and identify packages."""
+    repo_path = index.root
     monorepo_markers = {
         "lerna": "lerna.json",
         "pnpm": "pnpm-workspace.yaml",
@@ -1257,33 +1554,23 @@ def detect_monorepo(repo_path: str) -> Dict:
         marker_path = os.path.join(repo_path, marker)
         if os.path.exists(marker_path):
             if tool == "yarn_workspaces":
-                try:
-                    with open(marker_path, "r") as f:
-                        pkg = json.load(f)
-                    if "workspaces" in pkg:
-                        detected = "yarn_workspaces"
-                        # Find workspace packages
-                        workspaces = pkg["workspaces"]
-                        if isinstance(workspaces, dict):
-                            workspaces = workspaces.get("packages", [])
-                        for ws in workspaces:
-                            # Expand glob patterns
-                            import glob
-
-                            for match in glob.glob(os.path.join(repo_path, ws)):
-                                if os.path.isdir(match):
-                                    packages.append(os.path.relpath(match, repo_path))
-                except (IOError, json.JSONDecodeError):
-                    pass
+                pkg = index.package_json
+                if pkg is not None and "workspaces" in pkg:
+                    detected = "yarn_workspaces"
+                    # Find workspace packages
+                    workspaces = pkg["workspaces"]
+                    if isinstance(workspaces, dict):
+                        workspaces = workspaces.get("packages", [])
+                    for ws in workspaces:
+                        # Expand glob patterns
+                        for match in glob.iglob(os.path.join(repo_path, ws)):
+                            if os.path.isdir(match):
+                                packages.append(os.path.relpath(match, repo_path))
             else:
                 detected = tool
 
     # Count package.json files as a heuristic
-    pkg_count = 0
-    for root, dirs, files in os.walk(repo_path):
-        dirs[:] = [d for d in dirs if d not in ["node_modules", ".git"]]
-        if "package.json" in files:
-            pkg_count += 1
+    pkg_count = len(index.ecosystem_markers.get("package.json", ()))
 
     return {
         "is_monorepo": detected is not None or pkg_count > 3,
@@ -1352,43 +1639,49 @@ def analyze_repo(path: str = ".", sample_mode: bool = False) -> Dict[str, Any]:
     4. Configuration (Komono) - scattered items
     5. Legacy (Sentimental) - hardest decisions
     """
-    repo_path = get_repo_root(os.path.abspath(path))
+    # Git membership checks are cached for this analysis only, so a repository
+    # initialized or removed between calls is seen as it is now
+    git_cache = {}
+    repo_path = get_repo_root(os.path.abspath(path), git_cache)
+
+    # Walk the repository once; every file-based analyzer works from this index
+    index = collect_repo_index(repo_path)
 
     # Check repo size for sampling
-    file_count = count_files(repo_path)
+    file_count = len(index.files)
     is_large_repo = file_count > 10000
 
     if is_large_repo and not sample_mode:
         sample_mode = True
 
     # Detect monorepo
-    monorepo_info = detect_monorepo(repo_path)
+    monorepo_info = detect_monorepo(index)
 
     # Detect ecosystems
-    ecosystems = detect_ecosystems(repo_path)
+    ecosystems = detect_ecosystems(index)
 
     # Category 1: Dead Files (Clothing)
-    dead_files = find_dead_files(repo_path)
-    duplicates = find_duplicates(repo_path)
+    dead_files = find_dead_files(index)
+    duplicates = find_duplicates(index)
 
     # Category 2: Dependencies (Books)
-    orphaned_deps = find_all_orphaned_deps(repo_path)
+    orphaned_deps = find_all_orphaned_deps(index)
 
     # Category 3: Documentation (Papers)
-    doc_drift = find_documentation_drift(repo_path)
+    doc_drift = find_documentation_drift(index)
 
     # Category 4: Configuration (Komono)
-    orphaned_configs = find_orphaned_configs(repo_path)
+    orphaned_configs = find_orphaned_configs(index)
 
     # Category 5: Legacy (Sentimental)
-    legacy_code = find_legacy_code(repo_path)
+    legacy_code = find_legacy_code(index)
 
     # Git archaeology
-    commit_analysis = analyze_commits(repo_path)
-    stale_branches = find_stale_branches(repo_path)
+    commit_analysis = analyze_commits(repo_path, git_cache=git_cache)
+    stale_branches = find_stale_branches(repo_path, git_cache)
 
     # Context-heavy files (for awareness, not deletion)
-    context_heavy = find_context_heavy_files(repo_path)
+    context_heavy = find_context_heavy_files(index)
 
     # Build analysis result
     analysis = {
@@ -1494,4 +1787,6 @@ def analyze_repo(path: str = ".", sample_mode: bool = False) -> Dict[str, Any]:
 if __name__ == "__main__":
     path = sys.argv[1] if len(sys.argv) > 1 else "."
     result = analyze_repo(path)
-    print(json.dumps(result, indent=2, default=str))
+    # Stream the report instead of building the whole JSON string first
+    json.dump(result, sys.stdout, indent=2, default=str)
+    sys.stdout.write("\n")